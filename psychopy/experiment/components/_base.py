@@ -948,7 +948,7 @@ class BaseVisualComponent(BaseComponent):
                  stopType='duration (s)', stopVal='',
                  startEstim='', durationEstim='',
                  saveStartStop=True, syncScreenRefresh=True,
-                 disabled=False):
+                 disabled=False, excludeParams=()):
 
         super(BaseVisualComponent, self).__init__(
             exp, parentName, name,
@@ -974,90 +974,102 @@ class BaseVisualComponent(BaseComponent):
             "ori",
         ]
 
-        msg = _translate("Units of dimensions for this stimulus")
-        self.params['units'] = Param(units,
-            valType='str', inputType="choice", categ='Layout',
-            allowedVals=['from exp settings', 'deg', 'cm', 'pix', 'norm',
-                         'height', 'degFlatPos', 'degFlat'],
-            hint=msg,
-            label=_translate("Spatial units"))
-
-        msg = _translate("Foreground color of this stimulus (e.g. $[1,1,0], red )")
-        self.params['color'] = Param(color,
-            valType='color', inputType="color", categ='Appearance',
-            allowedTypes=[],
-            updates='constant',
-            allowedUpdates=['constant', 'set every repeat', 'set every frame'],
-            hint=msg,
-            label=_translate("Foreground color"))
-
-        msg = _translate("In what format (color space) have you specified "
-                         "the colors? (rgb, dkl, lms, hsv)")
-        self.params['colorSpace'] = Param(colorSpace,
-            valType='str', inputType="choice", categ='Appearance',
-            allowedVals=['rgb', 'dkl', 'lms', 'hsv'],
-            updates='constant',
-            hint=msg,
-            label=_translate("Color space"))
-
-        msg = _translate("Fill color of this stimulus (e.g. $[1,1,0], red )")
-        self.params['fillColor'] = Param(fillColor,
-            valType='color', inputType="color", categ='Appearance',
-            updates='constant', allowedTypes=[],
-            allowedUpdates=['constant', 'set every repeat', 'set every frame'],
-            hint=msg,
-            label=_translate("Fill color"))
-
-        msg = _translate("Border color of this stimulus (e.g. $[1,1,0], red )")
-        self.params['borderColor'] = Param(borderColor,
-            valType='color', inputType="color", categ='Appearance',
-            updates='constant',allowedTypes=[],
-            allowedUpdates=['constant', 'set every repeat', 'set every frame'],
-            hint=msg,
-            label=_translate("Border color"))
-
-        msg = _translate("Opacity of the stimulus (1=opaque, 0=fully transparent, 0.5=translucent). "
-                         "Leave blank for each color to have its own opacity (recommended if any color is None).")
-        self.params['opacity'] = Param(opacity,
-            valType='num', inputType="single", categ='Appearance',
-            updates='constant', allowedTypes=[],
-            allowedUpdates=['constant', 'set every repeat', 'set every frame'],
-            hint=msg,
-            label=_translate("Opacity"))
-
-        msg = _translate("Contrast of the stimulus (1.0=unchanged contrast, "
-                         "0.5=decrease contrast, 0.0=uniform/no contrast, "
-                         "-0.5=slightly inverted, -1.0=totally inverted)")
-        self.params['contrast'] = Param(contrast,
-            valType='num', inputType='single', allowedTypes=[], categ='Appearance',
-            updates='constant',
-            allowedUpdates=['constant', 'set every repeat', 'set every frame'],
-            hint=msg,
-            label=_translate("Contrast"))
-
-        msg = _translate("Position of this stimulus (e.g. [1,2] )")
-        self.params['pos'] = Param(pos,
-            valType='list', inputType="single", categ='Layout',
-            updates='constant', allowedTypes=[],
-            allowedUpdates=['constant', 'set every repeat', 'set every frame'],
-            hint=msg,
-            label=_translate("Position [x,y]"))
-
-        msg = _translate("Size of this stimulus (either a single value or "
-                         "x,y pair, e.g. 2.5, [1,2] ")
-        self.params['size'] = Param(size,
-            valType='list', inputType="single", categ='Layout',
-            updates='constant', allowedTypes=[],
-            allowedUpdates=['constant', 'set every repeat', 'set every frame'],
-            hint=msg,
-            label=_translate("Size [w,h]"))
-
-        self.params['ori'] = Param(ori,
-            valType='num', inputType="spin", categ='Layout',
-            updates='constant', allowedTypes=[], allowedVals=[-360,360],
-            allowedUpdates=['constant', 'set every repeat', 'set every frame'],
-            hint=_translate("Orientation of this stimulus (in deg)"),
-            label=_translate("Orientation"))
+        # params named in `excludeParams` are skipped, for subclasses which
+        # don't use them (cheaper than creating then deleting them)
+        if 'units' not in excludeParams:
+            msg = _translate("Units of dimensions for this stimulus")
+            self.params['units'] = Param(units,
+                valType='str', inputType="choice", categ='Layout',
+                allowedVals=['from exp settings', 'deg', 'cm', 'pix', 'norm',
+                             'height', 'degFlatPos', 'degFlat'],
+                hint=msg,
+                label=_translate("Spatial units"))
+
+        if 'color' not in excludeParams:
+            msg = _translate("Foreground color of this stimulus (e.g. $[1,1,0], red )")
+            self.params['color'] = Param(color,
+                valType='color', inputType="color", categ='Appearance',
+                allowedTypes=[],
+                updates='constant',
+                allowedUpdates=['constant', 'set every repeat', 'set every frame'],
+                hint=msg,
+                label=_translate("Foreground color"))
+
+        if 'colorSpace' not in excludeParams:
+            msg = _translate("In what format (color space) have you specified "
+                             "the colors? (rgb, dkl, lms, hsv)")
+            self.params['colorSpace'] = Param(colorSpace,
+                valType='str', inputType="choice", categ='Appearance',
+                allowedVals=['rgb', 'dkl', 'lms', 'hsv'],
+                updates='constant',
+                hint=msg,
+                label=_translate("Color space"))
+
+        if 'fillColor' not in excludeParams:
+            msg = _translate("Fill color of this stimulus (e.g. $[1,1,0], red )")
+            self.params['fillColor'] = Param(fillColor,
+                valType='color', inputType="color", categ='Appearance',
+                updates='constant', allowedTypes=[],
+                allowedUpdates=['constant', 'set every repeat', 'set every frame'],
+                hint=msg,
+                label=_translate("Fill color"))
+
+        if 'borderColor' not in excludeParams:
+            msg = _translate("Border color of this stimulus (e.g. $[1,1,0], red )")
+            self.params['borderColor'] = Param(borderColor,
+                valType='color', inputType="color", categ='Appearance',
+                updates='constant',allowedTypes=[],
+                allowedUpdates=['constant', 'set every repeat', 'set every frame'],
+                hint=msg,
+                label=_translate("Border color"))
+
+        if 'opacity' not in excludeParams:
+            msg = _translate("Opacity of the stimulus (1=opaque, 0=fully transparent, 0.5=translucent). "
+                             "Leave blank for each color to have its own opacity (recommended if any color is None).")
+            self.params['opacity'] = Param(opacity,
+                valType='num', inputType="single", categ='Appearance',
+                updates='constant', allowedTypes=[],
+                allowedUpdates=['constant', 'set every repeat', 'set every frame'],
+                hint=msg,
+                label=_translate("Opacity"))
+
+        if 'contrast' not in excludeParams:
+            msg = _translate("Contrast of the stimulus (1.0=unchanged contrast, "
+                             "0.5=decrease contrast, 0.0=uniform/no contrast, "
+                             "-0.5=slightly inverted, -1.0=totally inverted)")
+            self.params['contrast'] = Param(contrast,
+                valType='num', inputType='single', allowedTypes=[], categ='Appearance',
+                updates='constant',
+                allowedUpdates=['constant', 'set every repeat', 'set every frame'],
+                hint=msg,
+                label=_translate("Contrast"))
+
+        if 'pos' not in excludeParams:
+            msg = _translate("Position of this stimulus (e.g. [1,2] )")
+            self.params['pos'] = Param(pos,
+                valType='list', inputType="single", categ='Layout',
+                updates='constant', allowedTypes=[],
+                allowedUpdates=['constant', 'set every repeat', 'set every frame'],
+                hint=msg,
+                label=_translate("Position [x,y]"))
+
+        if 'size' not in excludeParams:
+            msg = _translate("Size of this stimulus (either a single value or "
+                             "x,y pair, e.g. 2.5, [1,2] ")
+            self.params['size'] = Param(size,
+                valType='list', inputType="single", categ='Layout',
+                updates='constant', allowedTypes=[],
+                allowedUpdates=['constant', 'set every repeat', 'set every frame'],
+                hint=msg,
+                label=_translate("Size [w,h]"))
+
+        if 'ori' not in excludeParams:
+            self.params['ori'] = Param(ori,
+                valType='num', inputType="spin", categ='Layout',
+                updates='constant', allowedTypes=[], allowedVals=[-360,360],
+                allowedUpdates=['constant', 'set every repeat', 'set every frame'],
+                hint=_translate("Orientation of this stimulus (in deg)"),
+                label=_translate("Orientation"))
 
         self.params['syncScreenRefresh'].readOnly = True
 
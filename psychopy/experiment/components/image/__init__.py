@@ -5,6 +5,8 @@
 # Copyright (C) 2002-2018 Jonathan Peirce (C) 2019-2022 Open Science Tools Ltd.
 # Distributed under the terms of the GNU General Public License (GPL).
 
+import functools
+import string
 from pathlib import Path
 from psychopy.experiment.components import BaseVisualComponent, Param, getInitVals
 from psychopy.localization import _translate, _localized as __localized
@@ -18,6 +20,21 @@ _localized.update({'image': _translate('Image'),
                    'flipHoriz': _translate('Flip horizontally'),
                    'interpolate': _translate('Interpolate')})
 
+# param values which are written as `undefined` in JS
+_jsNoneVals = frozenset((None, 'None', 'none', '', 'sin'))
+
+
+def _isPlainVal(val):
+    """Check whether `repr(val)` shows all of `val`, so can be used to spot
+    changes to it (unlike e.g. numpy arrays, whose repr may be shortened).
+    """
+    if val is None or isinstance(val, (str, int, float)):
+        return True
+    if isinstance(val, (tuple, list)):
+        return all(_isPlainVal(item) for item in val)
+
+    return False
+
 
 class ImageComponent(BaseVisualComponent):
     """An event class for presenting image-based stimuli"""
@@ -27,6 +44,36 @@ class ImageComponent(BaseVisualComponent):
     iconFile = Path(__file__).parent / 'image.png'
     tooltip = _translate('Image: present images (bmp, jpg, tif...)')
 
+    # params substituted into the init code templates
+    _initParamNames = ('name', 'image', 'mask', 'anchor', 'ori', 'pos', 'size',
+                       'color', 'colorSpace', 'opacity', 'flipHoriz',
+                       'flipVert', 'texture resolution')
+    # init code templates, built once and shared by all instances
+    _pyInitTemplate = (
+        "{name} = visual.ImageStim(\n"
+        "    win=win,\n"
+        "    name='{name}', {units}\n"
+        "    image={image}, mask={mask}, anchor={anchor},\n"
+        "    ori={ori}, pos={pos}, size={size},\n"
+        "    color={color}, colorSpace={colorSpace}, opacity={opacity},\n"
+        "    flipHoriz={flipHoriz}, flipVert={flipVert},\n"
+        "    texRes={texture resolution}, interpolate={interpolate}, "
+        "depth={depth})\n"
+    )
+    _jsInitTemplate = (
+        "{name} = new visual.ImageStim({{\n"
+        "  win : psychoJS.window,\n"
+        "  name : '{name}', {units}\n"
+        "  image : {image}, mask : {mask},\n"
+        "  anchor : {anchor},\n"
+        "  ori : {ori}, pos : {pos}, size : {size},\n"
+        "  color : new util.Color({color}), opacity : {opacity},\n"
+        "  flipHoriz : {flipHoriz}, flipVert : {flipVert},\n"
+        "  texRes : {texture resolution}, interpolate : {interpolate}, "
+        "depth : {depth} \n"
+        "}});\n"
+    )
+
     def __init__(self, exp, parentName, name='image', image='', mask='',
                  interpolate='linear', units='from exp settings',
                  color='$[1,1,1]', colorSpace='rgb', pos=(0, 0),
@@ -41,7 +88,8 @@ class ImageComponent(BaseVisualComponent):
             pos=pos, size=size, ori=ori,
             startType=startType, startVal=startVal,
             stopType=stopType, stopVal=stopVal,
-            startEstim=startEstim, durationEstim=durationEstim)
+            startEstim=startEstim, durationEstim=durationEstim,
+            excludeParams=('fillColor', 'borderColor'))
         self.type = 'Image'
         self.url = "https://www.psychopy.org/builder/components/image.html"
         self.exp.requirePsychopyLibs(['visual'])
@@ -116,36 +164,84 @@ class ImageComponent(BaseVisualComponent):
             hint=_translate("Which point on the stimulus should be anchored to its exact position?"),
             label=_translate("Anchor"))
 
-        del self.params['fillColor']
-        del self.params['borderColor']
+        # last result of `getInitVals` for each target, see `_getInitVals`
+        self._initValsCache = {}
+
+    def _getInitVals(self, target):
+        """Get `getInitVals(self.params, target)`, reusing the last result
+        for `target` if no param has been replaced or changed since.
+        """
+        # only cache if every value can be compared through its repr
+        if not all(_isPlainVal(param.val) for param in self.params.values()):
+            self._initValsCache.pop(target, None)
+            return getInitVals(self.params, target)
+
+        key = tuple(
+            (name, id(param), repr(param.val), param.valType,
+             getattr(param, 'updates', None))
+            for name, param in self.params.items())
+        cached = self._initValsCache.get(target)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        inits = getInitVals(self.params, target)
+        self._initValsCache[target] = (key, inits)
+
+        return inits
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _parseInitTemplate(cls, target):
+        """Split the init code template for `target` into a tuple of literal
+        fragments and a tuple of the field names between them. Parsed once per
+        class and cached, rather than each time init code is written.
+        """
+        if target == 'PsychoJS':
+            template = cls._jsInitTemplate
+        else:
+            template = cls._pyInitTemplate
+
+        literals = []
+        fields = []
+        literal = ''
+        for text, field, _, _ in string.Formatter().parse(template):
+            literal += text  # escaped braces split a literal into pieces
+            if field is not None:
+                literals.append(literal)
+                fields.append(field)
+                literal = ''
+        literals.append(literal)
+
+        return tuple(literals), tuple(fields)
+
+    def _fillInitTemplate(self, target, values):
+        """Fill the parsed init code template for `target` from a dict of
+        already formatted `str` values.
+        """
+        literals, fields = self._parseInitTemplate(target)
+        # interleave literals with values, then join in one go
+        code = [None] * (len(literals) + len(fields))
+        code[::2] = literals
+        code[1::2] = [values[field] for field in fields]
+
+        return ''.join(code)
 
     def writeInitCode(self, buff):
         # do we need units code?
         if self.params['units'].val == 'from exp settings':
             unitsStr = ""
         else:
-            unitsStr = "units=%(units)s, " % self.params
+            unitsStr = f"units={self.params['units']}, "
 
         # replace variable params with defaults
-        inits = getInitVals(self.params, 'PsychoPy')
-        code = ("{inits[name]} = visual.ImageStim(\n"
-                "    win=win,\n"
-                "    name='{inits[name]}', {units}\n"
-                "    image={inits[image]}, mask={inits[mask]}, anchor={inits[anchor]},\n"
-                "    ori={inits[ori]}, pos={inits[pos]}, size={inits[size]},\n"
-                "    color={inits[color]}, colorSpace={inits[colorSpace]}, opacity={inits[opacity]},\n"
-                "    flipHoriz={inits[flipHoriz]}, flipVert={inits[flipVert]},\n"
-                # no newline - start optional parameters
-                "    texRes={inits[texture resolution]}"
-                .format(inits=inits,
-                        units=unitsStr))
-
-        if self.params['interpolate'].val == 'linear':
-            code += ", interpolate=True"
-        else:
-            code += ", interpolate=False"
-        depth = -self.getPosInRoutine()
-        code += ", depth=%.1f)\n" % depth
+        inits = self._getInitVals('PsychoPy')
+        # convert to plain strings once, rather than on each substitution
+        initStrs = {name: str(inits[name]) for name in self._initParamNames}
+        code = self._fillInitTemplate('PsychoPy', dict(
+            initStrs,
+            units=unitsStr,
+            interpolate=str(self.params['interpolate'].val == 'linear'),
+            depth=f"{-self.getPosInRoutine():.1f}"))
         buff.writeIndentedLines(code)
 
     def writeInitCodeJS(self, buff):
@@ -153,41 +249,27 @@ class ImageComponent(BaseVisualComponent):
         if self.params['units'].val == 'from exp settings':
             unitsStr = "units : undefined, "
         else:
-            unitsStr = "units : %(units)s, " % self.params
+            unitsStr = f"units : {self.params['units']}, "
 
         # replace variable params with defaults
-        inits = getInitVals(self.params, 'PsychoJS')
+        inits = self._getInitVals('PsychoJS')
 
-        for paramName in inits:
+        # build JS values as plain strings, leaving the params untouched
+        initStrs = {}
+        for paramName in self._initParamNames:
             val = inits[paramName].val
             if val is True:
-                inits[paramName] = 'true'
+                initStrs[paramName] = 'true'
             elif val is False:
-                inits[paramName] = 'false'
-            elif val in [None, 'None', 'none', '', 'sin']:
-                inits[paramName].valType = 'code'
-                inits[paramName].val = 'undefined'
-
-        code = ("{inits[name]} = new visual.ImageStim({{\n"
-                "  win : psychoJS.window,\n"
-                "  name : '{inits[name]}', {units}\n"
-                "  image : {inits[image]}, mask : {inits[mask]},\n"
-                "  anchor : {inits[anchor]},\n"
-                "  ori : {inits[ori]}, pos : {inits[pos]}, size : {inits[size]},\n"
-                "  color : new util.Color({inits[color]}), opacity : {inits[opacity]},\n"
-                "  flipHoriz : {inits[flipHoriz]}, flipVert : {inits[flipVert]},\n"
-                # no newline - start optional parameters
-                "  texRes : {inits[texture resolution]}"
-                .format(inits=inits,
-                        units=unitsStr))
-
-        if self.params['interpolate'].val == 'linear':
-            code += ", interpolate : true"
-        else:
-            code += ", interpolate : false"
+                initStrs[paramName] = 'false'
+            elif (val is None or isinstance(val, str)) and val in _jsNoneVals:
+                initStrs[paramName] = 'undefined'
+            else:
+                initStrs[paramName] = str(inits[paramName])
 
-        depth = -self.getPosInRoutine()
-        code += (", depth : %.1f \n"
-                 "});\n" % (depth)
-                 )
+        code = self._fillInitTemplate('PsychoJS', dict(
+            initStrs,
+            units=unitsStr,
+            interpolate=str(self.params['interpolate'].val == 'linear').lower(),
+            depth=f"{-self.getPosInRoutine():.1f}"))
         buff.writeIndentedLines(code)
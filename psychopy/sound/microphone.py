@@ -19,16 +19,30 @@ from .audiodevice import *
 from .exceptions import *
 import numpy as np
 
-_hasPTB = True
-try:
-    import psychtoolbox.audio as audio
-except (ImportError, ModuleNotFoundError):
-    logging.warning(
-        "The 'psychtoolbox' library cannot be loaded but is required for audio "
-        "capture (use `pip install psychtoolbox` to get it). Microphone "
-        "recording will be unavailable this session. Note that opening a "
-        "microphone stream will raise an error.")
-    _hasPTB = False
+# `psychtoolbox.audio`, imported on first use by `_getAudioLib()` so a missing
+# PTB only raises an error once a microphone is actually used
+audio = None
+
+
+def _getAudioLib():
+    """Get the `psychtoolbox.audio` module, importing it if needed.
+
+    Returns
+    -------
+    module
+        The `psychtoolbox.audio` module.
+
+    """
+    global audio
+    if audio is None:
+        try:
+            import psychtoolbox.audio as audio
+        except (ImportError, ModuleNotFoundError):
+            raise ModuleNotFoundError(
+                "Microphone audio capture requires package `psychtoolbox` to "
+                "be installed (use `pip install psychtoolbox` to get it).")
+
+    return audio
 
 
 class RecordingBuffer:
@@ -72,6 +86,7 @@ class RecordingBuffer:
         self._samples = None  # `ndarray` created in _allocRecBuffer`
         self._offset = 0  # recording offset
         self._lastSample = 0  # offset of the last sample from stream
+        self._highSample = 0  # furthest sample written since last clear
         self._spaceRemaining = None  # set in `_allocRecBuffer`
         self._totalSamples = None  # set in `_allocRecBuffer`
 
@@ -99,6 +114,7 @@ class RecordingBuffer:
         assert self._samples.nbytes == nBytes
         self._totalSamples = len(self._samples)
         self._spaceRemaining = self._totalSamples
+        self._highSample = 0
 
     @property
     def samples(self):
@@ -259,6 +275,8 @@ class RecordingBuffer:
 
         self._samples[self._offset:self._lastSample, :] = audioData
         self._offset += nSamples
+        if self._lastSample > self._highSample:
+            self._highSample = self._lastSample
 
         self._spaceRemaining -= nSamples
 
@@ -271,14 +289,16 @@ class RecordingBuffer:
         return 0 if d < 0 else d
 
     def clear(self):
+        # Reuse the existing buffer rather than allocating a new one, segments
+        # taken from it are copies so nothing else refers to it. Only zero as
+        # far as samples were written, which may be past `_lastSample` if an
+        # earlier recording was longer.
+        self._samples[:self._highSample, :] = 0
         # reset all live attributes
-        self._samples = None
         self._offset = 0
         self._lastSample = 0
-        self._spaceRemaining = None
-        self._totalSamples = None
-        # reallocate buffer
-        self._allocRecBuffer()
+        self._highSample = 0
+        self._spaceRemaining = self._totalSamples
 
     def getSegment(self, start=0, end=None):
         """Get a segment of recording data as an `AudioClip`.
@@ -383,6 +403,15 @@ class Microphone:
         audioClip = mic.getRecording()
 
     """
+    # Attributes used internally get slots for quicker access. `__dict__` is
+    # kept since Builder scripts set timing attributes (e.g. `tStart`) on
+    # microphone instances.
+    __slots__ = (
+        '_device', '_sampleRateHz', '_audioLatencyMode', '_channels',
+        '_streamBufferSecs', '_mode', '_stream', '_audioRunMode',
+        '_statusFlag', '_recording', '_isStarted', 'clips', 'lastClip',
+        'scripts', 'lastScript', '__dict__', '__weakref__')
+
     # Force the use of WASAPI for audio capture on Windows. If `True`, only
     # WASAPI devices will be returned when calling static method
     # `Microphone.getDevices()`
@@ -398,11 +427,8 @@ class Microphone:
                  audioLatencyMode=None,
                  audioRunMode=0):
 
-        if not _hasPTB:  # fail if PTB is not installed
-            raise ModuleNotFoundError(
-                "Microphone audio capture requires package `psychtoolbox` to "
-                "be installed.")
-        
+        audio = _getAudioLib()  # fail if PTB is not installed
+
         def _getDeviceByIndex(deviceIndex):
             """Subroutine to get a device by index. Used to handle the case 
             where the user specifies a device by index.
@@ -424,8 +450,14 @@ class Microphone:
             # get all audio devices
             devices_ = Microphone.getDevices()
 
-            # get information about the selected device
+            # get information about the selected device, looking for devices
+            # again if not cached since it may have been connected since
             devicesByIndex = {d.deviceIndex: d for d in devices_}
+            if deviceIndex not in devicesByIndex:
+                Microphone.refreshDevices()
+                devicesByIndex = {
+                    d.deviceIndex: d for d in Microphone.getDevices()}
+
             if deviceIndex in devicesByIndex:
                 useDevice = devicesByIndex[deviceIndex]
             else:
@@ -443,6 +475,10 @@ class Microphone:
         else:
             # get default device, first enumerated usually
             devices = Microphone.getDevices()
+            if not devices:  # look again, one may have been connected since
+                Microphone.refreshDevices()
+                devices = Microphone.getDevices()
+
             if not devices:
                 raise AudioInvalidCaptureDeviceError(
                     'No suitable audio recording devices found on this system. '
@@ -490,8 +526,19 @@ class Microphone:
                 'Invalid number of channels for audio input specified.')
 
         # internal recording buffer size in seconds
-        assert isinstance(streamBufferSecs, (float, int))
-        self._streamBufferSecs = float(streamBufferSecs)
+        try:
+            self._streamBufferSecs = float(streamBufferSecs)
+        except (TypeError, ValueError):
+            raise TypeError(
+                "Invalid value for `streamBufferSecs`, must be a number.")
+
+        # check the value itself before casting, so `0.7` or `'1'` aren't
+        # truncated or parsed into a valid mode
+        if audioRunMode not in (0, 1):
+            raise ValueError(
+                "Invalid value for `audioRunMode`, must be `0` or `1`.")
+
+        self._audioRunMode = int(audioRunMode)
 
         # PTB specific stuff
         self._mode = 2  # open a stream in capture mode
@@ -510,9 +557,6 @@ class Microphone:
 
         logging.debug('Stream opened')
 
-        assert isinstance(audioRunMode, (float, int)) and \
-               (audioRunMode == 0 or audioRunMode == 1)
-        self._audioRunMode = int(audioRunMode)
         self._stream.run_mode = self._audioRunMode
 
         logging.debug('Set run mode to `{}`'.format(
@@ -524,8 +568,10 @@ class Microphone:
         logging.debug('Set stream latency bias to {} ms'.format(
             self._stream.latency_bias))
 
-        # pre-allocate recording buffer, called once
-        self._stream.get_audio_data(self._streamBufferSecs)
+        # pre-allocate recording buffer, called once. The stream has not been
+        # started yet so no samples are returned, only PTB's internal buffer
+        # is allocated. Don't keep a reference to the (empty) result.
+        self._stream.get_audio_data(secs_allocate=self._streamBufferSecs)
 
         logging.debug(
             'Allocated stream buffer to hold {} seconds of data'.format(
@@ -552,11 +598,18 @@ class Microphone:
         logging.debug('Audio capture device #{} ready'.format(
             self._device.deviceIndex))
 
+    # capture devices found by `getDevices()`, keyed by PTB device type
+    _getDevicesCache = {}
+
     @staticmethod
     def getDevices():
         """Get a `list` of audio capture device (i.e. microphones) descriptors.
         On Windows, only WASAPI devices are used.
 
+        Devices are only enumerated the first time this is called, since
+        querying PTB is slow. Call :meth:`refreshDevices` to look for devices
+        which have been connected since.
+
         Returns
         -------
         list
@@ -569,21 +622,33 @@ class Microphone:
         except KeyError:
             pass  # use default if option not present in settings
 
-        # query PTB for devices
         if Microphone.enforceWASAPI and sys.platform == 'win32':
-            allDevs = audio.get_devices(device_type=13)
+            deviceType = 13
         else:
-            allDevs = audio.get_devices()
+            deviceType = None
+
+        if deviceType not in Microphone._getDevicesCache:
+            # query PTB for devices
+            audio = _getAudioLib()
+            allDevs = audio.get_devices(device_type=deviceType)
 
-        # make sure we have an array of descriptors
-        allDevs = [allDevs] if isinstance(allDevs, dict) else allDevs
+            # make sure we have an array of descriptors
+            allDevs = (allDevs,) if isinstance(allDevs, dict) else allDevs
 
-        # create list of descriptors only for capture devices
-        inputDevices = [desc for desc in [
-            AudioDeviceInfo.createFromPTBDesc(dev) for dev in allDevs]
-                     if desc.isCapture]
+            # create list of descriptors only for capture devices
+            Microphone._getDevicesCache[deviceType] = [
+                desc for desc in (
+                    AudioDeviceInfo.createFromPTBDesc(dev) for dev in allDevs)
+                if desc.isCapture]
 
-        return inputDevices
+        return list(Microphone._getDevicesCache[deviceType])
+
+    @staticmethod
+    def refreshDevices():
+        """Clear cached device descriptors so the next call to
+        :meth:`getDevices` queries the system again.
+        """
+        Microphone._getDevicesCache.clear()
 
     # def warmUp(self):
     #     """Warm-/wake-up the audio stream.
@@ -672,8 +737,7 @@ class Microphone:
         :attr:`~psychopy.sound.microphone.Microphone.streamStatus` property.
 
         """
-        if hasattr(self, "_statusFlag"):
-            return self._statusFlag
+        return self._statusFlag
 
     @status.setter
     def status(self, value):
@@ -1,5 +1,6 @@
 from psychopy.experiment import Experiment
 from psychopy.experiment.components.image import ImageComponent
+from psychopy.experiment.exports import IndentingBuffer
 from psychopy.experiment.loops import TrialHandler
 from psychopy.experiment.routines import Routine
 from .test_base_components import _TestDepthMixin, _TestBaseComponentsMixin
@@ -22,3 +23,47 @@ class TestImage(_TestBaseComponentsMixin, _TestDepthMixin):
         # Make a rect for when we need something to click on
         self.comp = ImageComponent(exp=self.exp, parentName="testRoutine", name="testImage")
         self.routine.addComponent(self.comp)
+
+    def test_init_code_js_repeatable(self):
+        """Writing JS init code shouldn't alter params, so repeat writes match"""
+        scripts = []
+        for _ in range(2):
+            buff = IndentingBuffer(target="PsychoJS")
+            self.comp.writeInitCodeJS(buff)
+            scripts.append(buff.getvalue())
+        assert scripts[0] == scripts[1]
+        # empty image and mask should be undefined in JS
+        assert "image : undefined, mask : undefined" in scripts[0]
+
+    def test_init_code_follows_param_changes(self):
+        """Init code should reflect params changed since it was last written"""
+        for target, write in (("PsychoPy", self.comp.writeInitCode),
+                              ("PsychoJS", self.comp.writeInitCodeJS)):
+            self.comp.params['image'].val = "first.png"
+            buff = IndentingBuffer(target=target)
+            write(buff)
+            assert "first.png" in buff.getvalue()
+            # change value in place, then write again
+            self.comp.params['image'].val = "second.png"
+            buff = IndentingBuffer(target=target)
+            write(buff)
+            assert "second.png" in buff.getvalue()
+            assert "first.png" not in buff.getvalue()
+
+    def test_init_vals_follow_opaque_changes(self):
+        """Init values should reflect in-place edits to values whose repr
+        doesn't show their contents (e.g. large numpy arrays)
+        """
+        class Opaque:
+            def __init__(self):
+                self.contents = [0]
+
+            def __repr__(self):
+                return "Opaque(...)"
+
+        self.comp.params['size'].val = Opaque()
+        self.comp._getInitVals('PsychoPy')
+        # edit the value in place, without changing its repr
+        self.comp.params['size'].val.contents[0] = 1
+        inits = self.comp._getInitVals('PsychoPy')
+        assert inits['size'].val.contents == [1]
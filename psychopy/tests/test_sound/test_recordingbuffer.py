@@ -0,0 +1,25 @@
+"""Tests for the `RecordingBuffer` class used by `Microphone`.
+"""
+import numpy as np
+from psychopy.sound.microphone import RecordingBuffer
+
+
+def test_recordingbuffer_clear():
+    """Clearing the buffer should wipe all samples, including those written
+    past the end of the last recording by an earlier, longer one.
+    """
+    rb = RecordingBuffer(channels=2, maxRecordingSize=8)  # 1000 samples
+    buffer = rb.samples
+
+    # long recording, then a shorter one starting over at the beginning
+    rb.write(np.ones((500, 2), dtype=np.float32))
+    rb.seek(-rb.writeOffset)
+    assert rb.writeOffset == 0
+    rb.write(np.ones((10, 2), dtype=np.float32))
+    rb.clear()
+
+    assert rb.samples is buffer  # reused, not reallocated
+    assert not np.any(rb.samples)
+    assert rb.lastSample == 0
+    assert rb.writeOffset == 0
+    assert rb.spaceRemaining == rb.totalSamples
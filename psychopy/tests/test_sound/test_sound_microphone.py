@@ -0,0 +1,116 @@
+"""Tests for the `Microphone` class which don't need audio hardware, PTB is
+replaced by a fake `psychtoolbox.audio` module.
+"""
+import pytest
+from unittest.mock import patch
+from psychopy.sound.audiodevice import AudioDeviceInfo
+from psychopy.sound.microphone import Microphone
+
+# descriptor for a capture device, as returned by `audio.get_devices()`
+_ptbDeviceDesc = {
+    'DeviceIndex': 0, 'DeviceName': 'Fake Microphone',
+    'HostAudioAPIName': 'ALSA', 'NrOutputChannels': 0, 'NrInputChannels': 2,
+    'LowOutputLatency': 0.0, 'HighOutputLatency': 0.0,
+    'LowInputLatency': 0.01, 'HighInputLatency': 0.02,
+    'DefaultSampleRate': 48000}
+
+
+class _FakeStream:
+    """Stands in for `psychtoolbox.audio.Stream`, keeps track of the streams
+    which have been opened."""
+    opened = []
+
+    def __init__(self, **kwargs):
+        self.run_mode = 0
+        self.latency_bias = 0.0
+        _FakeStream.opened.append(self)
+
+    def get_audio_data(self, secs_allocate=0):
+        return None
+
+
+class _FakeAudio:
+    """Stands in for the `psychtoolbox.audio` module."""
+    Stream = _FakeStream
+
+    def __init__(self):
+        self.devices = [_ptbDeviceDesc]  # connected devices
+        self.devicesQueried = 0
+
+    def get_devices(self, device_type=None):
+        self.devicesQueried += 1
+        return list(self.devices)
+
+
+class TestMicrophoneArgs:
+    def setup_method(self):
+        _FakeStream.opened.clear()
+        self.audio = _FakeAudio()
+        self.patcher = patch(
+            'psychopy.sound.microphone._getAudioLib', return_value=self.audio)
+        self.patcher.start()
+        self.device = AudioDeviceInfo.createFromPTBDesc(_ptbDeviceDesc)
+
+    def teardown_method(self):
+        self.patcher.stop()
+
+    def test_valid_args(self):
+        mic = Microphone(device=self.device, streamBufferSecs='4',
+                         audioLatencyMode=0, audioRunMode=1)
+        assert mic.streamBufferSecs == 4.0
+        assert len(_FakeStream.opened) == 1
+        assert _FakeStream.opened[0].run_mode == 1
+
+    @pytest.mark.parametrize("streamBufferSecs", [None, 'two', [2]])
+    def test_invalid_stream_buffer_secs(self, streamBufferSecs):
+        with pytest.raises(TypeError):
+            Microphone(device=self.device, streamBufferSecs=streamBufferSecs,
+                       audioLatencyMode=0)
+        # should fail before a stream is opened
+        assert not _FakeStream.opened
+
+    @pytest.mark.parametrize("audioRunMode", [0.7, '1', 2, None])
+    def test_invalid_audio_run_mode(self, audioRunMode):
+        with pytest.raises(ValueError):
+            Microphone(device=self.device, audioRunMode=audioRunMode,
+                       audioLatencyMode=0)
+        # should fail before a stream is opened
+        assert not _FakeStream.opened
+
+
+class TestMicrophoneDevices:
+    def setup_method(self):
+        Microphone.refreshDevices()
+        self.audio = _FakeAudio()
+        self.patcher = patch(
+            'psychopy.sound.microphone._getAudioLib', return_value=self.audio)
+        self.patcher.start()
+
+    def teardown_method(self):
+        self.patcher.stop()
+        Microphone.refreshDevices()
+
+    def test_devices_cached(self):
+        devices = Microphone.getDevices()
+        assert [d.deviceIndex for d in devices] == [0]
+        # second call should use the cache rather than query PTB
+        assert Microphone.getDevices() == devices
+        assert self.audio.devicesQueried == 1
+        # refreshing should query PTB again
+        Microphone.refreshDevices()
+        Microphone.getDevices()
+        assert self.audio.devicesQueried == 2
+
+    def test_device_connected_after_cache(self):
+        Microphone.getDevices()
+        # connect another device after the devices have been cached
+        self.audio.devices.append(dict(_ptbDeviceDesc, DeviceIndex=1))
+        mic = Microphone(device=1, audioLatencyMode=0)
+        assert mic._device.deviceIndex == 1
+
+    def test_first_device_connected_after_cache(self):
+        self.audio.devices.clear()
+        assert Microphone.getDevices() == []
+        self.audio.devices.append(_ptbDeviceDesc)
+        mic = Microphone(audioLatencyMode=0)
+        assert mic._device.deviceIndex == 0